@@ -2,6 +2,8 @@ import hashlib
 import json
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import List
 
 from ..models.specification_result import (
@@ -17,6 +19,24 @@ from ..models.specification_workflow import (
 )
 from ..ports.specification_ports import SpecificationWorkflowPort
 
+_DISALLOWED_CHARS_RE = re.compile(r'[^\w\s\.\,\:\;\-\(\)]')
+
+_COMPONENT_KEYWORDS: tuple[tuple[tuple[str, ...], tuple[str, ...]], ...] = (
+    (("dashboard",), ("frontend/dashboard", "backend/metrics-service")),
+    (("api", "interface"), ("api/gateway",)),
+)
+
+_SPECIFICATION_TITLE = "Especificação Técnica Gerada"
+_SPECIFICATION_ARCHITECTURE = "Seguindo padrões do projeto ctxfy"
+_SPECIFICATION_INTERFACES = ("REST API", "Message Queue")
+_SPECIFICATION_SECURITY = ("Authentication", "Authorization", "Data Encryption")
+_DEFAULT_ACCEPTANCE_CRITERIA = (
+    "Especificação gerada no formato JSON válido",
+    "Arquivo salvo no diretório ctxfy/specifications/",
+    "Conteúdo acessível para geração de código automatizada",
+)
+_METRICS_ACCEPTANCE_CRITERION = "Dashboard exibe métricas em tempo real"
+
 
 class SpecificationWorkflow(SpecificationWorkflowPort):
     def execute(self, workflow_definition: SpecificationWorkflowDefinition) -> SpecificationResult:
@@ -34,7 +54,7 @@ def execute_specification_workflow(
     cleaned_requirements = _clean_business_requirements(workflow_definition.requirements)
     spec_id = _generate_specification_id(cleaned_requirements)
     filename = _generate_specification_filename(cleaned_requirements)
-    content = _format_specification_content(cleaned_requirements, str(workflow_definition.save_directory), created_at)
+    content = _format_specification_content(cleaned_requirements, workflow_definition.save_directory, created_at)
 
     return SpecificationResult(
         id=spec_id,
@@ -44,24 +64,25 @@ def execute_specification_workflow(
 
 
 def _validate_business_requirements(requirements: BusinessRequirements) -> bool:
-    return bool(requirements and str(requirements).strip())
+    return bool(requirements) and not requirements.isspace()
 
 
 def _clean_business_requirements(requirements: BusinessRequirements) -> str:
     if not requirements:
         return ""
-    return re.sub(r'[^\w\s\.\,\:\;\-\(\)]', '', str(requirements)).strip()
+    return _DISALLOWED_CHARS_RE.sub('', str(requirements)).strip()
 
 
 def _extract_important_words(text: str, max_words: int = 3, min_length: int = 4) -> List[str]:
     if not text:
         return ["spec"]
     words = text.lower().split()
-    return [w for w in words if len(w) >= min_length][:max_words]
+    return list(islice((w for w in words if len(w) >= min_length), max_words))
 
 
+@lru_cache(maxsize=1024)
 def _generate_specification_id(content: str) -> SpecificationId:
-    return SpecificationId(hashlib.sha256(content.encode()).hexdigest()[:8])
+    return SpecificationId(hashlib.blake2b(content.encode(), digest_size=4).hexdigest())
 
 
 def _generate_specification_filename(content: str) -> SpecificationFilename:
@@ -71,27 +92,29 @@ def _generate_specification_filename(content: str) -> SpecificationFilename:
 
 
 def _extract_components_from_requirements(requirements: str, save_directory: str = "ctxfy/specifications/") -> list[str]:
+    lowered = requirements.lower()
     components = [save_directory]
-    if "dashboard" in requirements.lower():
-        components.extend(["frontend/dashboard", "backend/metrics-service"])
-    if "api" in requirements.lower() or "interface" in requirements.lower():
-        components.append("api/gateway")
+    for keywords, keyword_components in _COMPONENT_KEYWORDS:
+        for keyword in keywords:
+            if keyword in lowered:
+                components.extend(keyword_components)
+                break
     return components
 
 
-def _generate_description(requirements: str) -> str:
-    words = requirements.split()
-    return " ".join(words[:15]) + ("..." if len(words) > 15 else "")
+def _generate_description(requirements: str, max_words: int = 15) -> str:
+    # The extra split keeps the unsplit remainder, which only exists when there are more words
+    words = requirements.split(maxsplit=max_words)
+    if len(words) > max_words:
+        return " ".join(words[:max_words]) + "..."
+    return " ".join(words)
 
 
 def _generate_acceptance_criteria(requirements: str) -> list[str]:
-    criteria = [
-        "Especificação gerada no formato JSON válido",
-        "Arquivo salvo no diretório ctxfy/specifications/",
-        "Conteúdo acessível para geração de código automatizada"
-    ]
-    if "metrics" in requirements.lower() or "métricas" in requirements.lower():
-        criteria.append("Dashboard exibe métricas em tempo real")
+    criteria = list(_DEFAULT_ACCEPTANCE_CRITERIA)
+    lowered = requirements.lower()
+    if "metrics" in lowered or "métricas" in lowered:
+        criteria.append(_METRICS_ACCEPTANCE_CRITERION)
     return criteria
 
 
@@ -99,13 +122,13 @@ def _format_specification_content(requirements: str, save_directory: str = "ctxf
     components = _extract_components_from_requirements(requirements, save_directory)
 
     content_str = json.dumps({
-        "title": "Especificação Técnica Gerada",
+        "title": _SPECIFICATION_TITLE,
         "description": _generate_description(requirements),
         "business_requirements": requirements,
-        "architecture": "Seguindo padrões do projeto ctxfy",
+        "architecture": _SPECIFICATION_ARCHITECTURE,
         "components": components,
-        "interfaces": ["REST API", "Message Queue"],
-        "security": ["Authentication", "Authorization", "Data Encryption"],
+        "interfaces": _SPECIFICATION_INTERFACES,
+        "security": _SPECIFICATION_SECURITY,
         "acceptance_criteria": _generate_acceptance_criteria(requirements),
         "created_at": created_at
     }, indent=2, ensure_ascii=False)
@@ -1,4 +1,6 @@
+import copy
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import yaml
@@ -8,6 +10,24 @@ from src.core.utils.path_utils import get_project_root
 from src.settings import Settings
 from src.shell.utils.retry_utils import execute_with_retry
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=64)
+def _parse_yaml(abspath: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime) and safe to share across threads"""
+    with open(abspath, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def _read_yaml(path: str) -> Any:
+    """Return an independent copy of the parsed YAML file"""
+    abspath = os.path.abspath(path)
+    return copy.deepcopy(_parse_yaml(abspath, os.stat(abspath).st_mtime_ns))
+
 
 class YAMLPromptLoader(PromptLoaderPort):
     def __init__(self) -> None:
@@ -29,11 +49,11 @@ class YAMLPromptLoader(PromptLoaderPort):
 
         if self._all_prompts_data is None:
             if not os.path.exists(self.prompts_file_path):
+                self._loaded_prompts[prompt_name] = None
                 return None
 
             def load_yaml_file() -> Any:
-                with open(self.prompts_file_path, 'r', encoding='utf-8') as file:
-                    return yaml.safe_load(file)
+                return _read_yaml(self.prompts_file_path)
 
             try:
                 all_data: Any = execute_with_retry(load_yaml_file)
@@ -48,8 +68,14 @@ class YAMLPromptLoader(PromptLoaderPort):
             self._loaded_prompts[prompt_name] = self._all_prompts_data[prompt_name]
             return self._all_prompts_data[prompt_name]  # type: ignore[no-any-return]
 
+        self._loaded_prompts[prompt_name] = None
         return None
 
     @property
     def all_prompts_data(self) -> Optional[Dict[str, Any]]:
         return self._all_prompts_data
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """Forget the YAML files parsed so far by any loader in this process"""
+        _parse_yaml.cache_clear()
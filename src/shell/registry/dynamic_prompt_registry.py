@@ -1,4 +1,5 @@
 import inspect
+import string
 from typing import Any, Callable, Dict
 
 from fastmcp import Context, FastMCP
@@ -55,6 +56,8 @@ class DynamicPromptRegistry:
         return dynamic_prompt_impl
 
     def _create_prompt_implementation(self, prompt_name: str, template: str, parameters: list[dict[str, Any]]) -> Callable[..., Any]:
+        template_fields = self._extract_template_fields(template)
+
         async def dynamic_prompt_impl(ctx: Context, *args: Any, **kwargs: Any) -> str:
             param_values: Dict[str, Any] = {}
 
@@ -71,14 +74,33 @@ class DynamicPromptRegistry:
                     else:
                         raise ValueError(f"Missing required parameter '{param_name}' for prompt {prompt_name}") from None
 
+            for field_name in template_fields:
+                if field_name not in param_values:
+                    raise ValueError(f"Missing required parameter '{field_name}' for prompt {prompt_name}")
+
             try:
-                result: str = template.format(**param_values)
+                result: str = template.format_map(param_values)
                 return result
             except KeyError as e:
                 raise ValueError(f"Missing required parameter {e} for prompt {prompt_name}") from e
 
         return dynamic_prompt_impl
 
+    def _extract_template_fields(self, template: str) -> tuple[str, ...]:
+        fields: dict[str, None] = {}
+        try:
+            parsed = list(string.Formatter().parse(template))
+        except ValueError:
+            # Malformed templates keep failing at call time, as str.format would
+            return ()
+        for _, field_name, _, _ in parsed:
+            if not field_name:
+                continue
+            root_name = field_name.split('.', 1)[0].split('[', 1)[0]
+            if root_name and not root_name.isdigit():
+                fields[root_name] = None
+        return tuple(fields)
+
     def _build_signature(self, parameters: list[dict[str, Any]]) -> inspect.Signature:
         sig_params = []
 
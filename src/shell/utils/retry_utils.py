@@ -4,6 +4,9 @@ from typing import Awaitable, Callable, TypeVar
 
 T = TypeVar('T')
 
+RETRY_DELAY_SECONDS = 1.0
+
+
 def execute_with_retry(fn: Callable[[], T], max_retries: int = 3) -> T:
     """Execute function with retry strategy"""
     for attempt in range(max_retries):
@@ -12,7 +15,7 @@ def execute_with_retry(fn: Callable[[], T], max_retries: int = 3) -> T:
         except Exception:
             if attempt == max_retries - 1:
                 raise
-            time.sleep(1)  # Fixed delay between retries
+            time.sleep(RETRY_DELAY_SECONDS)  # Fixed delay between retries
     # This line should never be reached, but added to satisfy mypy
     raise RuntimeError("Unexpected state in execute_with_retry")
 
@@ -25,7 +28,7 @@ async def execute_async_with_retry(coro: Callable[[], Awaitable[T]], max_retries
         except Exception:
             if attempt == max_retries - 1:
                 raise
-            await asyncio.sleep(1)  # Fixed delay between retries
+            await asyncio.sleep(RETRY_DELAY_SECONDS)  # Fixed delay between retries
     # This line should never be reached, but added to satisfy mypy
     raise RuntimeError("Unexpected state in execute_async_with_retry")
 
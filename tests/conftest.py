@@ -0,0 +1,9 @@
+import pytest
+
+from src.shell.utils import retry_utils
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    """Set the retry_utils delay between attempts to zero so failing attempts return at once"""
+    monkeypatch.setattr(retry_utils, "RETRY_DELAY_SECONDS", 0)
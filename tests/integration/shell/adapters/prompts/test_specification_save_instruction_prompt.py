@@ -1,11 +1,10 @@
-import pytest
-
 from src.core.models.specification_result import SaveDirectoryPath
 from src.core.models.specification_workflow import BusinessRequirements
 from src.shell.adapters.prompt_loaders.yaml_prompt_loader import YAMLPromptLoader
 
+_DEFAULT_SAVE_DIRECTORY = SaveDirectoryPath("ctxfy/specifications/")
+
 
-@pytest.mark.asyncio
 async def test_generate_returns_proper_instructions():
     loader = YAMLPromptLoader()
 
@@ -14,19 +13,18 @@ async def test_generate_returns_proper_instructions():
     template = prompt_template.get('template', '')
 
     result = template.format(
-        save_directory=str(SaveDirectoryPath("ctxfy/specifications/")),
+        save_directory=str(_DEFAULT_SAVE_DIRECTORY),
         business_requirements=str(BusinessRequirements("Requisitos de negócio para teste"))
     )
 
     assert result is not None
-    assert "ctxfy/specifications/" in result
+    assert _DEFAULT_SAVE_DIRECTORY in result
     assert "SAVE INSTRUCTIONS" in result
     assert "Create the" in result
     assert "Save the complete specification file" in result
     assert "Requisitos de negócio para teste" in result
 
 
-@pytest.mark.asyncio
 async def test_generate_with_custom_directory():
     """Test that the prompt accepts custom directory"""
     loader = YAMLPromptLoader()
@@ -47,7 +45,6 @@ async def test_generate_with_custom_directory():
     assert "Requisitos de negócio" in result
 
 
-@pytest.mark.asyncio
 async def test_generate_uses_default_directory():
     """Test that the prompt uses default directory when not specified"""
     loader = YAMLPromptLoader()
@@ -57,11 +54,11 @@ async def test_generate_uses_default_directory():
     template = prompt_template.get('template', '')
 
     result = template.format(
-        save_directory="ctxfy/specifications/",
+        save_directory=_DEFAULT_SAVE_DIRECTORY,
         business_requirements="Requisitos de negócio"
     )
 
     assert result is not None
-    assert "ctxfy/specifications/" in result
+    assert _DEFAULT_SAVE_DIRECTORY in result
     assert "SAVE INSTRUCTIONS" in result
     assert "Requisitos de negócio" in result
\ No newline at end of file
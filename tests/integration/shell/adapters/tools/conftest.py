@@ -0,0 +1,30 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.use_cases.generate_specification import GenerateSpecificationUseCase
+
+
+@pytest.fixture(scope="session")
+def make_use_case():
+    """Factory for use case doubles that return result or raise error from execute"""
+    def _make(result=None, error=None):
+        use_case = MagicMock(spec=GenerateSpecificationUseCase)
+        if error is not None:
+            use_case.execute.side_effect = error
+        else:
+            use_case.execute.return_value = result
+        return use_case
+    return _make
+
+
+@pytest.fixture(scope="module")
+def shared_ctx_mock():
+    return AsyncMock()
+
+
+@pytest.fixture
+def ctx_mock(shared_ctx_mock):
+    """Module-wide context double, cleared so each test sees only its own calls"""
+    shared_ctx_mock.reset_mock(return_value=True, side_effect=True)
+    return shared_ctx_mock
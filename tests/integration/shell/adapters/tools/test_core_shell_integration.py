@@ -1,6 +1,5 @@
 from datetime import datetime, timezone
-
-import pytest
+from unittest.mock import AsyncMock
 
 from src.core.models.specification_result import SaveDirectoryPath
 from src.core.models.specification_workflow import (
@@ -14,6 +13,8 @@ from src.shell.adapters.tools.specification_generation_tool import (
     SpecificationGenerationTool,
 )
 
+_DASHBOARD_REQUIREMENTS = BusinessRequirements("Create a comprehensive user dashboard")
+
 
 class TestCoreShellIntegration:
     """Integration tests for core use cases and workflows with shell adapters"""
@@ -60,12 +61,9 @@ class TestCoreShellIntegration:
         assert "user" in result.content.lower()
         assert "test/specifications/" in result.content
 
-    @pytest.mark.asyncio
     async def test_specification_generation_tool_with_real_use_case(self):
         """Integration test: Shell tool with real use case"""
         # This test needs to be async as the tool's execute method is async
-        from unittest.mock import AsyncMock
-
         # Arrange
         use_case = GenerateSpecificationUseCase()
         tool = SpecificationGenerationTool(use_case)
@@ -86,8 +84,9 @@ class TestCoreShellIntegration:
 
         # Verify context calls
         assert mock_ctx.info.called
-        assert any("Iniciando geração" in str(call) for call in mock_ctx.info.call_args_list)
-        assert any("gerada com ID" in str(call) for call in mock_ctx.info.call_args_list)
+        info_log = "\n".join(map(str, mock_ctx.info.call_args_list))
+        assert "Iniciando geração" in info_log
+        assert "gerada com ID" in info_log
 
     def test_yaml_prompt_loader_basic_file_operations(self):
         """Integration test: Basic file operations with YAML loader"""
@@ -110,14 +109,14 @@ class TestCoreShellIntegration:
         # Act: This mimics the shell-to-core flow
         use_case = GenerateSpecificationUseCase()
         result = use_case.execute(
-            BusinessRequirements("Create a comprehensive user dashboard"), 
+            _DASHBOARD_REQUIREMENTS, 
             created_at
         )
         
         # Additional core workflow processing (simulating what would happen in real system)
         # This verifies that the whole data flow works properly
         workflow_def = SpecificationWorkflowDefinition(
-            requirements=BusinessRequirements("Create a comprehensive user dashboard"),
+            requirements=_DASHBOARD_REQUIREMENTS,
             save_directory=SaveDirectoryPath("ctxfy/specifications/")
         )
         
@@ -1,5 +1,3 @@
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from src.core.models.specification_result import (
@@ -8,23 +6,21 @@ from src.core.models.specification_result import (
     SpecificationId,
     SpecificationResult,
 )
-from src.core.use_cases.generate_specification import GenerateSpecificationUseCase
 from src.shell.adapters.tools.specification_generation_tool import (
     SpecificationGenerationTool,
 )
 
+# Frozen, so every test can hand out the same instance
+_SAMPLE_RESULT = SpecificationResult(
+    id=SpecificationId("test-id-123"),
+    content=SpecificationContent('{"test": "content"}'),
+    filename=SpecificationFilename("test_spec.json")
+)
+
 
-@pytest.mark.asyncio
-async def test_execute_with_valid_requirements():
-    mock_use_case = MagicMock(spec=GenerateSpecificationUseCase)
-    mock_result = SpecificationResult(
-        id=SpecificationId("test-id-123"),
-        content=SpecificationContent('{"test": "content"}'),
-        filename=SpecificationFilename("test_spec.json")
-    )
-    mock_use_case.execute.return_value = mock_result
+async def test_execute_with_valid_requirements(make_use_case, ctx_mock):
+    mock_use_case = make_use_case(result=_SAMPLE_RESULT)
 
-    ctx_mock = AsyncMock()
     tool = SpecificationGenerationTool(use_case=mock_use_case)
 
     result = await tool.execute(ctx_mock, "Requisitos de negócio válidos")
@@ -35,13 +31,10 @@ async def test_execute_with_valid_requirements():
     ctx_mock.info.assert_called()
 
 
-@pytest.mark.asyncio
-async def test_execute_with_invalid_requirements():
+async def test_execute_with_invalid_requirements(make_use_case, ctx_mock, no_retry_delay):
     """Test execution of tool with invalid requirements"""
-    mock_use_case = MagicMock(spec=GenerateSpecificationUseCase)
-    mock_use_case.execute.side_effect = ValueError("Requisitos inválidos")
+    mock_use_case = make_use_case(error=ValueError("Requisitos inválidos"))
 
-    ctx_mock = AsyncMock()
     tool = SpecificationGenerationTool(use_case=mock_use_case)
 
     with pytest.raises(ValueError):
@@ -50,18 +43,10 @@ async def test_execute_with_invalid_requirements():
     ctx_mock.error.assert_called()
 
 
-@pytest.mark.asyncio
-async def test_execute_logs_properly():
+async def test_execute_logs_properly(make_use_case, ctx_mock):
     """Test that execution performs proper logging"""
-    mock_use_case = MagicMock(spec=GenerateSpecificationUseCase)
-    mock_result = SpecificationResult(
-        id=SpecificationId("test-id-123"),
-        content=SpecificationContent('{"test": "content"}'),
-        filename=SpecificationFilename("test_spec.json")
-    )
-    mock_use_case.execute.return_value = mock_result
-
-    ctx_mock = AsyncMock()
+    mock_use_case = make_use_case(result=_SAMPLE_RESULT)
+
     tool = SpecificationGenerationTool(use_case=mock_use_case)
 
     await tool.execute(ctx_mock, "Test requirements for logging")
@@ -17,8 +17,9 @@ def test_mcp_orchestrator_components_registration():
 
     MCPOrchestrator(mock_mcp)
 
-    tool_calls = [call for call in mock_mcp.method_calls if call[0] == 'tool']
-    prompt_calls = [call for call in mock_mcp.method_calls if call[0] == 'prompt']
+    method_calls = mock_mcp.method_calls
+    tool_calls = [call for call in method_calls if call[0] == 'tool']
+    prompt_calls = [call for call in method_calls if call[0] == 'prompt']
 
     assert len(tool_calls) >= 1
     assert len(prompt_calls) >= 1
@@ -30,14 +31,15 @@ def test_mcp_orchestrator_integration_with_real_components():
 
     MCPOrchestrator(mock_mcp)
 
-    tool_registered = any(call[0] == 'tool' for call in mock_mcp.method_calls)
-    prompt_registered = any(call[0] == 'prompt' for call in mock_mcp.method_calls)
+    method_calls = mock_mcp.method_calls
+    tool_registered = any(call[0] == 'tool' for call in method_calls)
+    prompt_registered = any(call[0] == 'prompt' for call in method_calls)
 
     assert tool_registered
     assert prompt_registered
 
-    registered_tool_names = [call[2]['name'] for call in mock_mcp.method_calls if call[0] == 'tool' and 'name' in call[2]]
-    registered_prompt_names = [call[2]['name'] for call in mock_mcp.method_calls if call[0] == 'prompt' and 'name' in call[2]]
+    registered_tool_names = [call[2]['name'] for call in method_calls if call[0] == 'tool' and 'name' in call[2]]
+    registered_prompt_names = [call[2]['name'] for call in method_calls if call[0] == 'prompt' and 'name' in call[2]]
 
     assert "generate_specification" in registered_tool_names
-    assert "specification_save_instruction" in registered_prompt_names
\ No newline at end of file
+    assert "specification_save_instruction" in registered_prompt_names
@@ -1,3 +1,5 @@
+import asyncio
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock
@@ -9,12 +11,23 @@ from src.core.use_cases.process_task_use_case import ProcessTaskUseCase
 from src.shell.adapters.tools.process_task_tool import ProcessTaskTool
 
 
+@pytest.fixture(scope="class")
+def process_task_tool():
+    return ProcessTaskTool(use_case=ProcessTaskUseCase())
+
+
+@pytest.fixture(scope="class")
+def shared_ctx():
+    return AsyncMock(spec=Context)
+
+
 class TestProcessTaskTool:
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        self.use_case = ProcessTaskUseCase()
-        self.tool = ProcessTaskTool(use_case=self.use_case)
-        self.ctx = AsyncMock(spec=Context)
+    @pytest.fixture(autouse=True)
+    def _bind_fixtures(self, process_task_tool, shared_ctx):
+        """Reuse the stateless tool and context across the class, clearing recorded calls per test."""
+        shared_ctx.reset_mock(return_value=True, side_effect=True)
+        self.tool = process_task_tool
+        self.ctx = shared_ctx
 
     def test_process_task_creates_directory_structure(self):
         """Integration test: Verify that the tool creates the expected directory structure"""
@@ -25,7 +38,6 @@ class TestProcessTaskTool:
 
         try:
             # Execute the tool
-            import asyncio
             result = asyncio.run(self._execute_tool(temp_file_path))
             
             # Verify the result structure
@@ -56,7 +68,6 @@ class TestProcessTaskTool:
             # Clean up
             Path(temp_file_path).unlink()
             # Clean up the created task directory
-            import shutil
             if 'task_dir' in locals():
                 shutil.rmtree(task_dir.parent, ignore_errors=True)
 
@@ -79,7 +90,6 @@ class TestProcessTaskTool:
 
         try:
             # Execute the tool for both files
-            import asyncio
             result1 = asyncio.run(self._execute_tool(temp_file_path1))
             result2 = asyncio.run(self._execute_tool(temp_file_path2))
             
@@ -92,12 +102,9 @@ class TestProcessTaskTool:
             Path(temp_file_path1).unlink()
             Path(temp_file_path2).unlink()
             # Clean up any created directories
-            import shutil
             shutil.rmtree(Path(".ctxfy"), ignore_errors=True)
 
     def test_handles_nonexistent_file_gracefully(self):
         """Integration test: Verify that the tool handles nonexistent files appropriately"""
-        import asyncio
-
         with pytest.raises((Exception, FileNotFoundError)):
             asyncio.run(self._execute_tool("/non/existent/file.md"))
\ No newline at end of file
@@ -2,12 +2,13 @@ import sys
 from io import StringIO
 from unittest.mock import patch
 
+from fastmcp import FastMCP
+
+import src.app
 from src.app import create_mcp_server, run_stdio_server
 
 
 def test_create_mcp_server_returns_fastmcp_instance():
-    from fastmcp import FastMCP
-
     server = create_mcp_server()
 
     assert isinstance(server, FastMCP)
@@ -38,8 +39,6 @@ def test_run_stdio_server_calls_run_method():
 
 
 def test_main_execution_logic():
-    import src.app
-
     assert hasattr(src.app, 'run_stdio_server')
     assert callable(src.app.run_stdio_server)
 
@@ -0,0 +1,14 @@
+from pathlib import Path
+
+import pytest
+from pytest_asyncio import is_async_test
+
+_UNIT_TESTS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """Run every unit async test on the session event loop instead of a loop per test"""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and item.path.is_relative_to(_UNIT_TESTS_DIR):
+            item.add_marker(session_scope_marker, append=False)
@@ -112,7 +112,7 @@ def test_generate_specification_id_from_content():
     result = _generate_specification_id(content)
     
     assert isinstance(result, str)
-    assert len(result) == 8  # First 8 chars of SHA256 hash
+    assert len(result) == 8  # 4-byte BLAKE2b digest as hex
 
 
 def test_generate_specification_filename_from_content():
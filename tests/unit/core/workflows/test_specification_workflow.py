@@ -1,6 +1,3 @@
-from dataclasses import FrozenInstanceError
-from datetime import datetime, timezone
-
 import pytest
 
 from src.core.models.specification_result import SaveDirectoryPath
@@ -10,34 +7,35 @@ from src.core.models.specification_workflow import (
 )
 from src.core.workflows.specification_workflow import execute_specification_workflow
 
+_DEFAULT_SAVE_DIRECTORY = SaveDirectoryPath("ctxfy/specifications/")
+_CREATED_AT = "2024-01-01T12:00:00Z"
+
 
 def test_execute_specification_workflow_with_valid_requirements_and_timestamp():
     workflow_def = SpecificationWorkflowDefinition(
         requirements=BusinessRequirements("User needs dashboard for metrics"),
-        save_directory=SaveDirectoryPath("ctxfy/specifications/")
+        save_directory=_DEFAULT_SAVE_DIRECTORY
     )
-    created_at = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
 
-    result = execute_specification_workflow(workflow_def, created_at)
+    result = execute_specification_workflow(workflow_def, _CREATED_AT)
 
     assert result.id is not None
     assert result.filename.startswith("spec_")
     assert result.filename.endswith(".json")
     assert result.content.startswith('{')
     assert "dashboard" in result.content.lower()
-    assert created_at in result.content
+    assert _CREATED_AT in result.content
 
 
 def test_execute_specification_workflow_with_empty_requirements():
     """Test the specification workflow with empty requirements"""
     workflow_def = SpecificationWorkflowDefinition(
         requirements=BusinessRequirements(""),
-        save_directory=SaveDirectoryPath("ctxfy/specifications/")
+        save_directory=_DEFAULT_SAVE_DIRECTORY
     )
-    created_at = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
 
     with pytest.raises(ValueError):
-        execute_specification_workflow(workflow_def, created_at)
+        execute_specification_workflow(workflow_def, _CREATED_AT)
 
 
 def test_execute_specification_workflow_with_api_requirements():
@@ -46,40 +44,24 @@ def test_execute_specification_workflow_with_api_requirements():
         requirements=BusinessRequirements("System needs REST API for user management"),
         save_directory=SaveDirectoryPath("custom/path/")
     )
-    created_at = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
 
-    result = execute_specification_workflow(workflow_def, created_at)
+    result = execute_specification_workflow(workflow_def, _CREATED_AT)
 
     assert "api" in result.content.lower()
     assert "REST API" in result.content
     assert "user" in result.content or "users" in result.content
     assert "custom/path/" in result.content
-    assert created_at in result.content
-
-
-def test_execute_specification_workflow_result_immutability():
-    """Verify that the result value object is immutable"""
-    workflow_def = SpecificationWorkflowDefinition(
-        requirements=BusinessRequirements("Test requirements"),
-        save_directory=SaveDirectoryPath("ctxfy/specifications/")
-    )
-    created_at = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-
-    result = execute_specification_workflow(workflow_def, created_at)
-
-    with pytest.raises(FrozenInstanceError):
-        result.content = "new content"
+    assert _CREATED_AT in result.content
 
 
 def test_execute_specification_workflow_filename_generation():
     """Test meaningful filename generation by the workflow"""
     workflow_def = SpecificationWorkflowDefinition(
         requirements=BusinessRequirements("System for financial reports"),
-        save_directory=SaveDirectoryPath("ctxfy/specifications/")
+        save_directory=_DEFAULT_SAVE_DIRECTORY
     )
-    created_at = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
 
-    result = execute_specification_workflow(workflow_def, created_at)
+    result = execute_specification_workflow(workflow_def, _CREATED_AT)
 
     assert result.filename.startswith("spec_")
     assert result.filename.endswith(".json")
@@ -90,7 +72,7 @@ def test_execute_specification_workflow_with_empty_timestamp():
     """Test workflow works with empty timestamp (fallback behavior)"""
     workflow_def = SpecificationWorkflowDefinition(
         requirements=BusinessRequirements("Simple requirements"),
-        save_directory=SaveDirectoryPath("ctxfy/specifications/")
+        save_directory=_DEFAULT_SAVE_DIRECTORY
     )
 
     result = execute_specification_workflow(workflow_def, "")  # Empty timestamp
@@ -1,6 +1,8 @@
 
 import json
 
+import pytest
+
 from src.core.models.specification_result import SpecificationResult
 from src.core.models.specification_workflow import BusinessRequirements
 from src.core.workflows.specification_workflow import (
@@ -37,59 +39,39 @@ def test_validate_business_requirements_with_none_like_input():
     assert _validate_business_requirements(requirements) is True
 
 
-def test_clean_business_requirements_with_normal_input():
-    requirements = BusinessRequirements("User needs dashboard for metrics")
-    cleaned = _clean_business_requirements(requirements)
-    assert cleaned == "User needs dashboard for metrics"
-
-
-def test_clean_business_requirements_with_special_characters():
-    requirements = BusinessRequirements("User needs dashboard for metrics!@#$%")
-    cleaned = _clean_business_requirements(requirements)
-    assert cleaned == "User needs dashboard for metrics"
-
-
-def test_clean_business_requirements_with_punctuation():
-    requirements = BusinessRequirements("User needs dashboard: real-time metrics; monitoring (alerts)")
-    cleaned = _clean_business_requirements(requirements)
-    assert cleaned == "User needs dashboard: real-time metrics; monitoring (alerts)"
-
-
-def test_clean_business_requirements_with_empty_input():
-    requirements = BusinessRequirements("")
-    cleaned = _clean_business_requirements(requirements)
-    assert cleaned == ""
-
-
-def test_extract_important_words_with_multiple_words():
-    text = "dashboard for metrics and analytics"
-    result = _extract_important_words(text, max_words=3, min_length=4)
-    assert result == ["dashboard", "metrics", "analytics"]
-
-
-def test_extract_important_words_with_few_words():
-    text = "user interface"
-    result = _extract_important_words(text, max_words=5, min_length=3)
-    assert result == ["user", "interface"]
-
-
-def test_extract_important_words_with_short_words_filtered():
-    text = "a user needs an interface for the dashboard"
-    result = _extract_important_words(text, max_words=5, min_length=4)
-    assert "a" not in result
-    assert "an" not in result
-    assert "the" not in result
-    # "user" has 4 chars, so it should be included since min_length=4 means >= 4
-    assert "user" in result
-    assert "needs" in result
-    assert "interface" in result
-    assert "dashboard" in result
-
-
-def test_extract_important_words_with_empty_input():
-    text = ""
-    result = _extract_important_words(text, max_words=3, min_length=4)
-    assert result == ["spec"]
+@pytest.mark.parametrize("text,expected", [
+    ("User needs dashboard for metrics", "User needs dashboard for metrics"),
+    ("User needs dashboard for metrics!@#$%", "User needs dashboard for metrics"),
+    (
+        "User needs dashboard: real-time metrics; monitoring (alerts)",
+        "User needs dashboard: real-time metrics; monitoring (alerts)",
+    ),
+    ("", ""),
+], ids=["normal", "special_characters", "punctuation", "empty"])
+def test_clean_business_requirements(text, expected):
+    assert _clean_business_requirements(BusinessRequirements(text)) == expected
+
+
+@pytest.mark.parametrize("text,max_words,min_length,expected", [
+    ("dashboard for metrics and analytics", 3, 4, ["dashboard", "metrics", "analytics"]),
+    ("user interface", 5, 3, ["user", "interface"]),
+    # "user" has 4 chars, so it is kept since min_length=4 means >= 4
+    ("a user needs an interface for the dashboard", 5, 4, ["user", "needs", "interface", "dashboard"]),
+    ("", 3, 4, ["spec"]),
+    ("word test case", 5, 4, ["word", "test", "case"]),
+    ("a word testing case example", 3, 4, ["word", "testing", "case"]),
+    ("a an the of", 5, 4, []),
+], ids=[
+    "multiple_words",
+    "few_words",
+    "short_words_filtered",
+    "empty_input",
+    "all_words_kept",
+    "max_words_limit",
+    "no_words_long_enough",
+])
+def test_extract_important_words(text, max_words, min_length, expected):
+    assert _extract_important_words(text, max_words=max_words, min_length=min_length) == expected
 
 
 def test_generate_specification_id_with_same_content():
@@ -163,6 +145,22 @@ def test_extract_components_from_requirements_with_interface():
     assert "api/gateway" in components
 
 
+def test_extract_components_from_requirements_with_api_and_interface():
+    requirements = "Dashboard interface backed by an API"
+    components = _extract_components_from_requirements(requirements)
+    assert components == [
+        "ctxfy/specifications/",
+        "frontend/dashboard",
+        "backend/metrics-service",
+        "api/gateway",
+    ]
+
+
+def test_extract_components_from_requirements_keeps_save_directory_first():
+    components = _extract_components_from_requirements("dashboard", "frontend/dashboard")
+    assert components == ["frontend/dashboard", "frontend/dashboard", "backend/metrics-service"]
+
+
 def test_extract_components_from_requirements_default():
     requirements = "Random requirement"
     components = _extract_components_from_requirements(requirements)
@@ -195,24 +193,21 @@ def test_generate_description_with_long_text():
         assert "..." in long_description
 
 
-def test_generate_acceptance_criteria_default_criteria():
-    requirements = "Random requirement"
+@pytest.mark.parametrize("requirements,has_metrics_criterion", [
+    ("Random requirement", False),
+    ("System with metrics and real-time monitoring", True),
+    ("System for file storage", False),
+    ("Sistema de métricas em tempo real", True),
+    ("System with real-time metrics", True),
+    ("System for file storage and backup", False),
+], ids=["default", "metrics", "no_metrics", "metricas", "real_time_metrics", "storage_and_backup"])
+def test_generate_acceptance_criteria(requirements, has_metrics_criterion):
     criteria = _generate_acceptance_criteria(requirements)
+
     assert "Especificação gerada no formato JSON válido" in criteria
     assert "Arquivo salvo no diretório ctxfy/specifications/" in criteria
     assert "Conteúdo acessível para geração de código automatizada" in criteria
-
-
-def test_generate_acceptance_criteria_metrics_criteria():
-    requirements = "System with metrics and real-time monitoring"
-    criteria = _generate_acceptance_criteria(requirements)
-    assert "Dashboard exibe métricas em tempo real" in criteria
-
-
-def test_generate_acceptance_criteria_no_metrics_criteria():
-    requirements = "System for file storage"
-    criteria = _generate_acceptance_criteria(requirements)
-    assert "Dashboard exibe métricas em tempo real" not in criteria
+    assert ("Dashboard exibe métricas em tempo real" in criteria) is has_metrics_criterion
 
 
 def test_format_specification_content_basic_structure():
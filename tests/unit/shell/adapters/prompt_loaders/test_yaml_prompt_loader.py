@@ -1,5 +1,29 @@
+from unittest.mock import patch
+
+import yaml
+
+from src.shell.adapters.prompt_loaders import yaml_prompt_loader
 from src.shell.adapters.prompt_loaders.yaml_prompt_loader import YAMLPromptLoader
 
+_PROMPTS_YAML = """
+prompts:
+  greeting:
+    description: "A greeting prompt"
+    template: "Hello {name}"
+"""
+
+
+def _loader_for(path):
+    loader = YAMLPromptLoader()
+    loader.prompts_file_path = str(path)
+    return loader
+
+
+def test_yaml_prompt_loader_prefers_libyaml_safe_loader():
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
+    assert yaml_prompt_loader.SafeLoader is expected
+
 
 def test_yaml_prompt_loader_initialization():
     loader = YAMLPromptLoader()
@@ -9,8 +33,6 @@ def test_yaml_prompt_loader_initialization():
     assert "resources" in loader.prompts_directory
 
 
-
-
 def test_yaml_prompt_loader_load_existing_prompt():
     loader = YAMLPromptLoader()
     result = loader.load_prompt_template("specification_save_instruction")
@@ -21,8 +43,6 @@ def test_yaml_prompt_loader_load_existing_prompt():
     assert result["name"] == "Specification Generation and Save Instruction Prompt"
 
 
-
-
 def test_yaml_prompt_loader_load_prompt_template_not_found():
     loader = YAMLPromptLoader()
     result = loader.load_prompt_template("non_existent_prompt")
@@ -30,12 +50,26 @@ def test_yaml_prompt_loader_load_prompt_template_not_found():
     assert result is None
 
 
+def test_yaml_prompt_loader_caches_missing_prompts(tmp_path):
+    loader = _loader_for(tmp_path / "missing.yaml")
 
+    assert loader.load_prompt_template("non_existent_prompt") is None
 
+    with patch.object(yaml_prompt_loader.os.path, "exists") as mock_exists:
+        assert loader.load_prompt_template("non_existent_prompt") is None
 
+    mock_exists.assert_not_called()
 
 
+def test_yaml_prompt_loader_does_not_cache_failed_loads(tmp_path):
+    prompts_file = tmp_path / "prompts.yaml"
+    prompts_file.write_text(_PROMPTS_YAML, encoding="utf-8")
+    loader = _loader_for(prompts_file)
 
+    with patch.object(yaml_prompt_loader, "execute_with_retry", side_effect=OSError("transient read error")):
+        assert loader.load_prompt_template("greeting") is None
+
+    assert loader.load_prompt_template("greeting") == {"description": "A greeting prompt", "template": "Hello {name}"}
 
 
 def test_yaml_prompt_loader_caching_behavior():
@@ -54,4 +88,39 @@ def test_yaml_prompt_loader_caching_behavior():
     assert result2 is not None
     assert result2["modified_in_cache"] is True
     # Restore original value
-    loader._loaded_prompts["specification_save_instruction"]["template"] = original_template
\ No newline at end of file
+    loader._loaded_prompts["specification_save_instruction"]["template"] = original_template
+
+
+def test_yaml_prompt_loader_parses_file_once_across_instances(tmp_path):
+    prompts_file = tmp_path / "prompts.yaml"
+    prompts_file.write_text(_PROMPTS_YAML, encoding="utf-8")
+
+    with patch.object(yaml_prompt_loader.yaml, "load", wraps=yaml.load) as mock_load:
+        first = _loader_for(prompts_file).load_prompt_template("greeting")
+        second = _loader_for(prompts_file).load_prompt_template("greeting")
+
+    assert first == second == {"description": "A greeting prompt", "template": "Hello {name}"}
+    assert mock_load.call_count == 1
+
+
+def test_yaml_prompt_loader_instances_do_not_share_mutations(tmp_path):
+    prompts_file = tmp_path / "prompts.yaml"
+    prompts_file.write_text(_PROMPTS_YAML, encoding="utf-8")
+
+    first = _loader_for(prompts_file).load_prompt_template("greeting")
+    first["modified_in_cache"] = True
+    second = _loader_for(prompts_file).load_prompt_template("greeting")
+
+    assert "modified_in_cache" not in second
+
+
+def test_yaml_prompt_loader_reset_cache_forces_reparse(tmp_path):
+    prompts_file = tmp_path / "prompts.yaml"
+    prompts_file.write_text(_PROMPTS_YAML, encoding="utf-8")
+
+    with patch.object(yaml_prompt_loader.yaml, "load", wraps=yaml.load) as mock_load:
+        _loader_for(prompts_file).load_prompt_template("greeting")
+        YAMLPromptLoader.reset_cache()
+        _loader_for(prompts_file).load_prompt_template("greeting")
+
+    assert mock_load.call_count == 2
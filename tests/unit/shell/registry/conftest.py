@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+import pytest
+from fastmcp import FastMCP
+
+from src.shell.adapters.prompt_loaders.yaml_prompt_loader import YAMLPromptLoader
+from src.shell.registry.dynamic_prompt_registry import DynamicPromptRegistry
+
+
+def _make_registry(yaml_loader):
+    with patch('src.shell.registry.dynamic_prompt_registry.YAMLPromptLoader', return_value=yaml_loader):
+        return DynamicPromptRegistry()
+
+
+@pytest.fixture(scope="session")
+def yaml_loader():
+    return YAMLPromptLoader()
+
+
+@pytest.fixture
+def registry(yaml_loader):
+    return _make_registry(yaml_loader)
+
+
+@pytest.fixture(scope="module")
+def shared_registry(yaml_loader):
+    """Registry for tests that only call its pure builder methods"""
+    return _make_registry(yaml_loader)
+
+
+@pytest.fixture
+def mcp():
+    return FastMCP()
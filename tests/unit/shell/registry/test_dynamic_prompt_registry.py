@@ -1,53 +1,94 @@
+import inspect
 from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
-from fastmcp import Context, FastMCP
+from fastmcp import Context
 
 from src.core.models.specification_result import SaveDirectoryPath
 from src.core.models.specification_workflow import BusinessRequirements
 from src.shell.registry.dynamic_prompt_registry import DynamicPromptRegistry
 
+_BASE_PROMPT_CONFIG = {
+    'description': 'A test prompt',
+    'template': 'Hello {name}',
+    'parameters': [
+        {'name': 'name', 'type': 'str'}
+    ]
+}
+
+_BASE_PROMPT_CONFIG_WITH_DEFAULT = {
+    **_BASE_PROMPT_CONFIG,
+    'parameters': [
+        {'name': 'name', 'type': 'str', 'default': 'World'}
+    ]
+}
+
+_TYPED_PARAMETERS = [
+    {'name': 'name', 'type': 'str'},
+    {'name': 'count', 'type': 'int'},
+    {'name': 'rate', 'type': 'float'},
+    {'name': 'active', 'type': 'bool'},
+    {'name': 'path', 'type': 'SaveDirectoryPath'},
+    {'name': 'requirements', 'type': 'BusinessRequirements'},
+    {'name': 'optional_str', 'type': 'str', 'default': 'default_value'},
+    {'name': 'optional_int', 'type': 'int', 'default': 42},
+    {'name': 'invalid_int', 'type': 'int', 'default': 'not_a_number'},
+    {'name': 'invalid_float', 'type': 'float', 'default': 'not_a_float'},
+    {'name': 'invalid_bool', 'type': 'bool', 'default': 'maybe'},
+]
+
+
+@pytest.fixture(scope="module")
+def typed_signature(shared_registry):
+    return shared_registry._build_signature(_TYPED_PARAMETERS)
+
+
+@pytest.fixture(scope="module")
+def typed_annotations(shared_registry):
+    return shared_registry._build_annotations(_TYPED_PARAMETERS)
+
+
+@pytest.fixture(scope="module")
+def hello_prompt_func(shared_registry):
+    return shared_registry._create_prompt_implementation(
+        'test-prompt', _BASE_PROMPT_CONFIG['template'], _BASE_PROMPT_CONFIG['parameters']
+    )
+
+
+@pytest.fixture(scope="module")
+def hello_prompt_func_with_default(shared_registry):
+    return shared_registry._create_prompt_implementation(
+        'test-prompt', _BASE_PROMPT_CONFIG['template'], [{'name': 'name', 'type': 'str', 'default': 'DefaultName'}]
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_ctx():
+    # The prompt implementations only pass the context through
+    return Mock(spec=Context)
+
 
 class TestDynamicPromptRegistry:
-    def test_initialization(self):
+    def test_initialization(self, registry):
         """Test that the DynamicPromptRegistry initializes correctly."""
-        registry = DynamicPromptRegistry()
-        
         assert registry._prompts == {}
         assert registry._registered_functions == {}
         assert registry._yaml_loader is not None
 
     @patch('src.shell.registry.dynamic_prompt_registry.YAMLPromptLoader')
-    def test_load_and_register_all_prompts_with_no_data_initially(self, mock_yaml_loader_class):
+    def test_load_and_register_all_prompts_with_no_data_initially(self, mock_yaml_loader_class, mcp):
         """Test loading and registering prompts when data is initially None."""
         # Create a mock instance
         mock_instance = Mock()
         mock_yaml_loader_class.return_value = mock_instance
         
-        # Set up the property to return different values on first and subsequent access
-        # We'll use side_effect to control the behavior
-        def all_prompts_data_property():
-            if not hasattr(self, '_access_count'):
-                self._access_count = 0
-            self._access_count += 1
-            if self._access_count == 1:
-                return None  # First access returns None
-            else:
-                return {
-                    'test-prompt': {
-                        'description': 'A test prompt',
-                        'template': 'Hello {name}',
-                        'parameters': [
-                            {'name': 'name', 'type': 'str', 'default': 'World'}
-                        ]
-                    }
-                }
-        
-        # Use PropertyMock to control the property behavior
-        type(mock_instance).all_prompts_data = PropertyMock(side_effect=all_prompts_data_property)
+        # First access returns None, the access after loading returns the data
+        type(mock_instance).all_prompts_data = PropertyMock(side_effect=[
+            None,
+            {'test-prompt': _BASE_PROMPT_CONFIG_WITH_DEFAULT},
+        ])
         
         registry = DynamicPromptRegistry()
-        mcp = FastMCP()
         
         registry.load_and_register_all_prompts(mcp)
         
@@ -57,26 +98,17 @@ class TestDynamicPromptRegistry:
         assert len(registry._registered_functions) == 1
 
     @patch('src.shell.registry.dynamic_prompt_registry.YAMLPromptLoader')
-    def test_load_and_register_all_prompts_with_existing_data(self, mock_yaml_loader_class):
+    def test_load_and_register_all_prompts_with_existing_data(self, mock_yaml_loader_class, mcp):
         """Test loading and registering prompts when data exists initially."""
         mock_instance = Mock()
         mock_yaml_loader_class.return_value = mock_instance
         
         # Set up the property to return data immediately
         type(mock_instance).all_prompts_data = PropertyMock(
-            return_value={
-                'test-prompt': {
-                    'description': 'A test prompt',
-                    'template': 'Hello {name}',
-                    'parameters': [
-                        {'name': 'name', 'type': 'str', 'default': 'World'}
-                    ]
-                }
-            }
+            return_value={'test-prompt': _BASE_PROMPT_CONFIG_WITH_DEFAULT}
         )
 
         registry = DynamicPromptRegistry()
-        mcp = FastMCP()
         
         registry.load_and_register_all_prompts(mcp)
         
@@ -86,7 +118,7 @@ class TestDynamicPromptRegistry:
         assert len(registry._registered_functions) == 1
 
     @patch('src.shell.registry.dynamic_prompt_registry.YAMLPromptLoader')
-    def test_load_and_register_all_prompts_with_empty_data(self, mock_yaml_loader_class):
+    def test_load_and_register_all_prompts_with_empty_data(self, mock_yaml_loader_class, mcp):
         """Test loading and registering prompts when data is empty."""
         mock_instance = Mock()
         mock_yaml_loader_class.return_value = mock_instance
@@ -95,28 +127,16 @@ class TestDynamicPromptRegistry:
         type(mock_instance).all_prompts_data = PropertyMock(return_value={})
 
         registry = DynamicPromptRegistry()
-        mcp = FastMCP()
         
         registry.load_and_register_all_prompts(mcp)
         
         # Verify that no functions were registered
         assert len(registry._registered_functions) == 0
 
-    def test_create_and_register_prompt(self):
+    def test_create_and_register_prompt(self, registry, mcp):
         """Test the _create_and_register_prompt method."""
-        registry = DynamicPromptRegistry()
-        mcp = FastMCP()
-        
-        prompt_config = {
-            'description': 'A test prompt',
-            'template': 'Hello {name}',
-            'parameters': [
-                {'name': 'name', 'type': 'str', 'default': 'World'}
-            ]
-        }
-        
         # Call the private method
-        registry._create_and_register_prompt(mcp, 'test-prompt', prompt_config)
+        registry._create_and_register_prompt(mcp, 'test-prompt', _BASE_PROMPT_CONFIG_WITH_DEFAULT)
         
         # Check that the function was registered
         assert 'test-prompt' in registry._registered_functions
@@ -124,22 +144,12 @@ class TestDynamicPromptRegistry:
         assert func.__name__ == 'test_prompt'
         assert func.__doc__ == 'A test prompt'
 
-    def test_create_dynamic_function(self):
+    def test_create_dynamic_function(self, registry):
         """Test the _create_dynamic_function method."""
-        registry = DynamicPromptRegistry()
-        
-        prompt_config = {
-            'description': 'A test prompt',
-            'template': 'Hello {name}',
-            'parameters': [
-                {'name': 'name', 'type': 'str', 'default': 'World'}
-            ]
-        }
-        
-        parameters = prompt_config['parameters']
+        parameters = _BASE_PROMPT_CONFIG_WITH_DEFAULT['parameters']
         
         # Call the private method
-        func = registry._create_dynamic_function('test-prompt', prompt_config, parameters)
+        func = registry._create_dynamic_function('test-prompt', _BASE_PROMPT_CONFIG_WITH_DEFAULT, parameters)
         
         # Check that the function was created with proper signature and annotations
         sig = func.__signature__
@@ -152,242 +162,91 @@ class TestDynamicPromptRegistry:
         assert annotations['return'] is str
         assert annotations['name'] is str
 
-    @pytest.mark.asyncio
-    async def test_create_prompt_implementation_with_args(self):
+    async def test_create_prompt_implementation_with_args(self, hello_prompt_func, mock_ctx):
         """Test the _create_prompt_implementation method with positional args."""
-        registry = DynamicPromptRegistry()
-        
-        prompt_config = {
-            'description': 'A test prompt',
-            'template': 'Hello {name}',
-            'parameters': [
-                {'name': 'name', 'type': 'str'}
-            ]
-        }
-        
-        parameters = prompt_config['parameters']
-        
-        # Call the private method
-        func = registry._create_prompt_implementation('test-prompt', 'Hello {name}', parameters)
-        
-        # Mock the context
-        mock_ctx = Mock()
-        
         # Call the async function with a positional argument
-        result = await func(mock_ctx, 'Alice')
+        result = await hello_prompt_func(mock_ctx, 'Alice')
         
         assert result == 'Hello Alice'
 
-    @pytest.mark.asyncio
-    async def test_create_prompt_implementation_with_kwargs(self):
+    async def test_create_prompt_implementation_with_kwargs(self, hello_prompt_func, mock_ctx):
         """Test the _create_prompt_implementation method with keyword args."""
-        registry = DynamicPromptRegistry()
-        
-        prompt_config = {
-            'description': 'A test prompt',
-            'template': 'Hello {name}',
-            'parameters': [
-                {'name': 'name', 'type': 'str'}
-            ]
-        }
-        
-        parameters = prompt_config['parameters']
-        
-        # Call the private method
-        func = registry._create_prompt_implementation('test-prompt', 'Hello {name}', parameters)
-        
-        # Mock the context
-        mock_ctx = Mock()
-        
         # Call the async function with a keyword argument
-        result = await func(mock_ctx, name='Bob')
+        result = await hello_prompt_func(mock_ctx, name='Bob')
         
         assert result == 'Hello Bob'
 
-    @pytest.mark.asyncio
-    async def test_create_prompt_implementation_with_default_value(self):
+    async def test_create_prompt_implementation_with_default_value(self, hello_prompt_func_with_default, mock_ctx):
         """Test the _create_prompt_implementation method with default values."""
-        registry = DynamicPromptRegistry()
-        
-        prompt_config = {
-            'description': 'A test prompt',
-            'template': 'Hello {name}',
-            'parameters': [
-                {'name': 'name', 'type': 'str', 'default': 'DefaultName'}
-            ]
-        }
-        
-        parameters = prompt_config['parameters']
-        
-        # Call the private method
-        func = registry._create_prompt_implementation('test-prompt', 'Hello {name}', parameters)
-        
-        # Mock the context
-        mock_ctx = Mock()
-        
         # Call the async function without providing the parameter (should use default)
-        result = await func(mock_ctx)
+        result = await hello_prompt_func_with_default(mock_ctx)
         
         assert result == 'Hello DefaultName'
 
-    @pytest.mark.asyncio
-    async def test_create_prompt_implementation_missing_required_parameter(self):
+    async def test_create_prompt_implementation_missing_required_parameter(self, hello_prompt_func, mock_ctx):
         """Test the _create_prompt_implementation method raises error for missing required parameter."""
-        registry = DynamicPromptRegistry()
-        
-        prompt_config = {
-            'description': 'A test prompt',
-            'template': 'Hello {name}',
-            'parameters': [
-                {'name': 'name', 'type': 'str'}  # No default value
-            ]
-        }
-        
-        parameters = prompt_config['parameters']
-        
-        # Call the private method
-        func = registry._create_prompt_implementation('test-prompt', 'Hello {name}', parameters)
-        
-        # Mock the context
-        mock_ctx = Mock()
-        
         # Call the async function without providing the required parameter should raise ValueError
         with pytest.raises(ValueError, match="Missing required parameter 'name' for prompt test-prompt"):
-            await func(mock_ctx)
+            await hello_prompt_func(mock_ctx)
 
-    @pytest.mark.asyncio
-    async def test_create_prompt_implementation_missing_template_parameter(self):
+    async def test_create_prompt_implementation_missing_template_parameter(self, registry, mock_ctx):
         """Test the _create_prompt_implementation method raises error for missing template parameter."""
-        registry = DynamicPromptRegistry()
-        
-        prompt_config = {
-            'description': 'A test prompt',
-            'template': 'Hello {name} and {other}',
-            'parameters': [
-                {'name': 'name', 'type': 'str', 'default': 'Default'}
-            ]
-        }
-        
-        parameters = prompt_config['parameters']
+        parameters = [{'name': 'name', 'type': 'str', 'default': 'Default'}]
         
         # Call the private method
         func = registry._create_prompt_implementation('test-prompt', 'Hello {name} and {other}', parameters)
         
-        # Mock the context
-        mock_ctx = Mock()
-        
         # Call the async function without providing 'other' parameter should raise ValueError
         with pytest.raises(ValueError, match="Missing required parameter 'other' for prompt test-prompt"):
             await func(mock_ctx)
 
-    def test_build_signature_with_various_types(self):
-        """Test the _build_signature method with various parameter types."""
-        registry = DynamicPromptRegistry()
-        
-        parameters = [
-            {'name': 'name', 'type': 'str'},
-            {'name': 'count', 'type': 'int'},
-            {'name': 'rate', 'type': 'float'},
-            {'name': 'active', 'type': 'bool'},
-            {'name': 'path', 'type': 'SaveDirectoryPath'},
-            {'name': 'requirements', 'type': 'BusinessRequirements'},
-            {'name': 'optional_str', 'type': 'str', 'default': 'default_value'},
-            {'name': 'optional_int', 'type': 'int', 'default': 42}
-        ]
-        
-        sig = registry._build_signature(parameters)
-        
-        # Check that all parameters are present
-        assert len(sig.parameters) == 9  # ctx + 8 other parameters
-        assert 'ctx' in sig.parameters
-        assert 'name' in sig.parameters
-        assert 'count' in sig.parameters
-        assert 'rate' in sig.parameters
-        assert 'active' in sig.parameters
-        assert 'path' in sig.parameters
-        assert 'requirements' in sig.parameters
-        assert 'optional_str' in sig.parameters
-        assert 'optional_int' in sig.parameters
-        
-        # Check types
-        assert sig.parameters['name'].annotation is str
-        assert sig.parameters['count'].annotation is int
-        assert sig.parameters['rate'].annotation is float
-        assert sig.parameters['active'].annotation is bool
-        assert sig.parameters['path'].annotation is SaveDirectoryPath
-        assert sig.parameters['requirements'].annotation is BusinessRequirements
-        assert sig.parameters['optional_str'].annotation is str
-        assert sig.parameters['optional_int'].annotation is int
-        
-        # Check defaults
-        assert sig.parameters['optional_str'].default == 'default_value'
-        assert sig.parameters['optional_int'].default == 42
-
-    def test_build_annotations_with_various_types(self):
-        """Test the _build_annotations method with various parameter types."""
-        registry = DynamicPromptRegistry()
-        
-        parameters = [
-            {'name': 'name', 'type': 'str'},
-            {'name': 'count', 'type': 'int'},
-            {'name': 'rate', 'type': 'float'},
-            {'name': 'active', 'type': 'bool'},
-            {'name': 'path', 'type': 'SaveDirectoryPath'},
-            {'name': 'requirements', 'type': 'BusinessRequirements'}
-        ]
-        
-        annotations = registry._build_annotations(parameters)
-        
-        # Check that all annotations are present
-        assert annotations['ctx'] is Context  # Fixed: use Context from fastmcp
-        assert annotations['return'] is str
-        assert annotations['name'] is str
-        assert annotations['count'] is int
-        assert annotations['rate'] is float
-        assert annotations['active'] is bool
-        assert annotations['path'] is SaveDirectoryPath
-        assert annotations['requirements'] is BusinessRequirements
-
-    def test_build_signature_with_invalid_default_conversion(self):
-        """Test the _build_signature method handles invalid default value conversions."""
-        registry = DynamicPromptRegistry()
-        
-        parameters = [
-            {'name': 'count', 'type': 'int', 'default': 'not_a_number'},
-            {'name': 'rate', 'type': 'float', 'default': 'not_a_float'},
-            {'name': 'active', 'type': 'bool', 'default': 'maybe'}
-        ]
-        
-        # This should not raise an exception, but use the original default value
-        sig = registry._build_signature(parameters)
-        
-        # Check that defaults are handled gracefully
-        assert sig.parameters['count'].default == 'not_a_number'
-        assert sig.parameters['rate'].default == 'not_a_float'
-        # For bool, it should convert string values properly
-        assert sig.parameters['active'].default in (True, False)  # Could be True due to string conversion logic
-
-    @pytest.mark.asyncio
-    async def test_dynamic_prompt_implementation_with_format_error(self):
+    def test_extract_template_fields(self, registry):
+        """Test that template field names are extracted once, in order and without duplicates."""
+        fields = registry._extract_template_fields('Hello {name}, {user.id} {items[0]} {0} {name}')
+
+        assert fields == ('name', 'user', 'items')
+
+    def test_extract_template_fields_with_malformed_template(self, registry):
+        """Test that malformed templates defer their error to formatting time."""
+        assert registry._extract_template_fields('Hello {name') == ()
+
+    @pytest.mark.parametrize("param_name,expected_type,expected_default", [
+        ('name', str, inspect.Parameter.empty),
+        ('count', int, inspect.Parameter.empty),
+        ('rate', float, inspect.Parameter.empty),
+        ('active', bool, inspect.Parameter.empty),
+        ('path', SaveDirectoryPath, inspect.Parameter.empty),
+        ('requirements', BusinessRequirements, inspect.Parameter.empty),
+        ('optional_str', str, 'default_value'),
+        ('optional_int', int, 42),
+        # Defaults that cannot be converted are kept as given
+        ('invalid_int', int, 'not_a_number'),
+        ('invalid_float', float, 'not_a_float'),
+        ('invalid_bool', bool, False),
+    ])
+    def test_build_signature_and_annotations(self, typed_signature, typed_annotations, param_name, expected_type, expected_default):
+        """Test that _build_signature and _build_annotations agree on each parameter's type and default."""
+        assert typed_signature.parameters[param_name].annotation is expected_type
+        assert typed_signature.parameters[param_name].default == expected_default
+        assert typed_annotations[param_name] is expected_type
+
+    def test_build_signature_and_annotations_include_context(self, typed_signature, typed_annotations):
+        """Test that the context parameter leads the signature and the return type is annotated."""
+        assert list(typed_signature.parameters)[0] == 'ctx'
+        assert len(typed_signature.parameters) == len(_TYPED_PARAMETERS) + 1
+        assert typed_signature.parameters['ctx'].annotation is Context
+        assert typed_annotations['ctx'] is Context
+        assert typed_annotations['return'] is str
+
+    async def test_dynamic_prompt_implementation_with_format_error(self, registry, mock_ctx):
         """Test that format errors in the template are properly handled."""
-        registry = DynamicPromptRegistry()
-        
         # Template with a parameter that's not provided
-        prompt_config = {
-            'description': 'A test prompt',
-            'template': 'Hello {name} and {missing_param}',
-            'parameters': [
-                {'name': 'name', 'type': 'str', 'default': 'World'}
-            ]
-        }
+        prompt_config = {**_BASE_PROMPT_CONFIG_WITH_DEFAULT, 'template': 'Hello {name} and {missing_param}'}
         
         parameters = prompt_config['parameters']
         
         # Call the private method
-        func = registry._create_prompt_implementation('test-prompt', 'Hello {name} and {missing_param}', parameters)
-        
-        # Mock the context
-        mock_ctx = Mock()
+        func = registry._create_prompt_implementation('test-prompt', prompt_config['template'], parameters)
         
         # Call the async function - this should raise a ValueError due to missing parameter in template
         with pytest.raises(ValueError, match="Missing required parameter 'missing_param' for prompt test-prompt"):
@@ -1,83 +1,47 @@
 
+from unittest.mock import AsyncMock, Mock
+
 import pytest
 
 from src.shell.utils.retry_utils import execute_async_with_retry, execute_with_retry
 
 
-def test_execute_with_retry_success_on_first_attempt():
-    """Test that execute_with_retry returns result immediately on success"""
-    call_count = 0
-    
-    def successful_function():
-        nonlocal call_count
-        call_count += 1
-        return "success"
-    
-    result = execute_with_retry(successful_function, max_retries=3)
-    
-    assert result == "success"
-    assert call_count == 1
+def _outcomes(fail_until, max_retries, exc_type):
+    """side_effect sequence failing fail_until times (capped at max_retries) before succeeding"""
+    failures = min(fail_until, max_retries)
+    return [exc_type(f"Failing on purpose - attempt {attempt}") for attempt in range(1, failures + 1)] + ["success"]
 
 
-def test_execute_with_retry_eventual_success():
-    """Test that execute_with_retry retries on failure and succeeds eventually"""
-    call_count = 0
-    
-    def eventually_successful_function():
-        nonlocal call_count
-        call_count += 1
-        if call_count < 3:
-            raise ValueError("Failing on purpose")
-        return "finally successful"
-    
-    result = execute_with_retry(eventually_successful_function, max_retries=5)
-    
-    assert result == "finally successful"
-    assert call_count == 3
+@pytest.mark.parametrize("fail_until,max_retries,expected_call_count,expect_raises", [
+    (0, 3, 1, None),
+    (2, 5, 3, None),
+    (999, 3, 3, ValueError),
+], ids=["success_on_first_attempt", "eventual_success", "fails_after_max_retries"])
+def test_execute_with_retry(fail_until, max_retries, expected_call_count, expect_raises, no_retry_delay):
+    """Test that execute_with_retry retries failures until success or max_retries"""
+    flaky = Mock(side_effect=_outcomes(fail_until, max_retries, ValueError))
 
+    if expect_raises:
+        with pytest.raises(expect_raises):
+            execute_with_retry(flaky, max_retries=max_retries)
+    else:
+        assert execute_with_retry(flaky, max_retries=max_retries) == "success"
 
-def test_execute_with_retry_fails_after_max_retries():
-    """Test that execute_with_retry raises exception after max retries"""
-    call_count = 0
-    
-    def always_failing_function():
-        nonlocal call_count
-        call_count += 1
-        raise ValueError(f"Always fails - attempt {call_count}")
-    
-    with pytest.raises(ValueError):
-        execute_with_retry(always_failing_function, max_retries=3)
-    
-    assert call_count == 3
+    assert flaky.call_count == expected_call_count
 
 
-@pytest.mark.asyncio
-async def test_execute_async_with_retry_success_on_first_attempt():
-    """Test that execute_async_with_retry returns result immediately on success"""
-    call_count = 0
-    
-    async def successful_async_function():
-        nonlocal call_count
-        call_count += 1
-        return "async success"
-    
-    result = await execute_async_with_retry(successful_async_function, max_retries=3)
-    
-    assert result == "async success"
-    assert call_count == 1
+@pytest.mark.parametrize("fail_until,max_retries,expected_call_count,expect_raises", [
+    (0, 3, 1, None),
+    (999, 2, 2, RuntimeError),
+], ids=["success_on_first_attempt", "fails_after_max_retries"])
+async def test_execute_async_with_retry(fail_until, max_retries, expected_call_count, expect_raises, no_retry_delay):
+    """Test that execute_async_with_retry retries failures until success or max_retries"""
+    flaky = AsyncMock(side_effect=_outcomes(fail_until, max_retries, RuntimeError))
 
+    if expect_raises:
+        with pytest.raises(expect_raises):
+            await execute_async_with_retry(flaky, max_retries=max_retries)
+    else:
+        assert await execute_async_with_retry(flaky, max_retries=max_retries) == "success"
 
-@pytest.mark.asyncio
-async def test_execute_async_with_retry_fails_after_max_retries():
-    """Test that execute_async_with_retry raises exception after max retries"""
-    call_count = 0
-    
-    async def always_failing_async_function():
-        nonlocal call_count
-        call_count += 1
-        raise RuntimeError(f"Always fails async - attempt {call_count}")
-    
-    with pytest.raises(RuntimeError):
-        await execute_async_with_retry(always_failing_async_function, max_retries=2)
-    
-    assert call_count == 2
\ No newline at end of file
+    assert flaky.await_count == expected_call_count